@@ -104,6 +104,10 @@ class CommandArgs:
 
         Additional keyword arguments are sent to the argument class.
 
+        Raises:
+            KeyError: the argument type doesn't exist.
+            ValueError: the argument can't follow the previous one.
+
         """
         arg_class = ARG_TYPES.get(arg_type)
         if arg_class is None:
@@ -112,6 +116,16 @@ class CommandArgs:
         dest = dest or arg_type
         argument = arg_class(dest, optional=optional, default=default,
                 **kwargs)
+
+        # An argument of unknown size takes everything up to the
+        # next argument, so two of them need a delimiter in between
+        if self.arguments and argument.space is ArgSpace.UNKNOWN:
+            previous = self.arguments[-1]
+            if previous.space is ArgSpace.UNKNOWN:
+                raise ValueError(
+                        f"{argument!r} can't follow {previous!r}, add "
+                        "a keyword or delimiter between them")
+
         self.arguments.append(argument)
         return argument
 
@@ -131,50 +145,52 @@ class CommandArgs:
             result (`Namespace` or `ArgumentError`): the parsed result.
 
         """
-        results = [None] * len(self.arguments)
+        # Without arguments, there's nothing to parse
+        if not self.arguments:
+            return Namespace()
+
+        num_args = len(self.arguments)
+        length = len(arguments)
+        results = [None] * num_args
 
         # Parse arguments with definite size
+        indexed = tuple(enumerate(self.arguments))
         attempts = (
                 # Strict arguments
-                [arg for arg in self.arguments if
+                [(i, arg) for i, arg in indexed if
                         arg.space is ArgSpace.STRICT],
                 # Fixed in length
-                [arg for arg in self.arguments if
+                [(i, arg) for i, arg in indexed if
                         arg.space is ArgSpace.WORD],
                 # Others
-                tuple(self.arguments),
+                indexed,
         )
 
         for attempt in attempts:
-            for arg in attempt:
-                i = self.arguments.index(arg)
+            for i, arg in attempt:
                 if results[i] is not None:
                     continue
 
                 # If there's a previous result, parse after it
                 begin = 0
-                if i > 0:
-                    prev_results = [result for result in results[:i]
-                            if isinstance(result, Result)]
-                    if prev_results:
-                        prev_result = prev_results[-1]
+                for j in range(i - 1, -1, -1):
+                    if isinstance(prev_result := results[j], Result):
                         begin = prev_result.end
+                        break
 
                 # Skip over spaces
-                while begin < len(arguments):
+                while begin < length:
                     if arguments[begin].isspace():
                         begin += 1
                     else:
                         break
 
                 # If there's a following result, parse before it
-                end = len(arguments)
-                if i < len(self.arguments) - 1:
-                    next_results = [result for result in results[i + 1:]
-                            if isinstance(result, Result)]
-                    if next_results:
-                        next_result = next_results[0]
+                end = length
+                for j in range(i + 1, num_args):
+                    if isinstance(next_result := results[j], Result):
                         end = next_result.begin
+                        break
 
                 if begin == end and not arg.optional:
                     return ArgumentError(arg.msg_mandatory.format(
@@ -188,15 +204,16 @@ class CommandArgs:
 
         # If an error has occurred, return the first
         # mandatory argument error
-        errors = [result for result in results if
+        errors = [(arg, result) for arg, result in
+                zip(self.arguments, results) if
                 isinstance(result, ArgumentError)]
         if errors:
-            mandatory = [result for result in errors if
-                    not self.arguments[results.index(result)].optional]
+            mandatory = [result for arg, result in errors if
+                    not arg.optional]
             if mandatory:
                 return mandatory[0]
 
-            return errors[0]
+            return errors[0][1]
 
         # Create the namespace
         namespace = Namespace()
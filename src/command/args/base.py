@@ -92,6 +92,4 @@ class Argument(metaclass=ArgMeta):
             if space_pos != -1:
                 end = space_pos
 
-            return Result(begin=begin, end=end, string=string)
-        else:
-            return Result(begin=begin, end=end, string=string)
+        return Result(begin=begin, end=end, string=string)
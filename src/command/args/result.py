@@ -31,7 +31,15 @@
 
 class Result:
 
-    """Result of a successful parsing of an argument."""
+    """
+    Result of a successful parsing of an argument.
+
+    Arguments can store the parsed value in the result (`value`),
+    or the parsed options (`options`).
+
+    """
+
+    __slots__ = ("begin", "end", "string", "value", "options")
 
     def __init__(self, begin, end, string):
         self.begin = begin
@@ -47,5 +55,7 @@ class DefaultResult:
 
     """A result that just wraps a default value."""
 
+    __slots__ = ("value", )
+
     def __init__(self, value):
         self.value = value
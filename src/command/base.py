@@ -29,13 +29,15 @@
 
 """Base class for commands."""
 
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from importlib import import_module
 import inspect
 from pathlib import Path
+import sys
 import traceback
-from typing import Any, Callable, Dict, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 from command.args import ArgumentError, CommandArgs, Namespace
 from command.log import logger
@@ -43,6 +45,12 @@ from tools.delay import Delay
 
 NOT_SET = object()
 
+# Command classes by module, {pypath: [command classes]}
+COMMANDS_BY_MODULE = defaultdict(list)
+
+# Variables found in command modules and packages, {(pypath, name): value}
+EXPLORED = {}
+
 class Command:
 
     """
@@ -142,6 +150,11 @@ class Command:
     seps = " "
     alias = ()
 
+    def __init_subclass__(cls, **kwargs):
+        """Register the command class in its module."""
+        super().__init_subclass__(**kwargs)
+        COMMANDS_BY_MODULE[cls.__module__].append(cls)
+
     def __init__(self, character=None, sep=None, arguments=""):
         self.character = character
         self.sep = sep
@@ -219,9 +232,10 @@ class Command:
         """Simply return an empty command argument parser."""
         return CommandArgs()
 
-    def parse(self, character: 'db.Character'):
+    def parse(self, character: 'db.Character') -> Union[Namespace,
+            ArgumentError]:
         """Parse the command, returning the namespace or an error."""
-        return type(self).args.parse(character, self.arguments)
+        return self.args.parse(character, self.arguments)
 
     async def run(self, args):
         """
@@ -278,8 +292,8 @@ class Command:
                     await self.msg(traceback.format_exc(), raw=True)
 
                 logger.exception(
-                        f"An error occurred while parsing and running the "
-                        f"{self.name} commnd:"
+                        "An error occurred while parsing and running the "
+                        "{} commnd:", self.name
                 )
 
     async def msg(self, text: str, raw: Optional[bool] = False):
@@ -316,6 +330,7 @@ class Command:
         # Try to find the command name
         if not hasattr(cls, "name"):
             cls.name = cls.__name__.lower()
+        cls.name = sys.intern(cls.name)
 
         # Try to find the command category, permissions and layer
         if any(not hasattr(cls, missing) for missing in
@@ -335,30 +350,43 @@ class Command:
                 layer = layer or "static"
                 cls.layer = layer
 
+        # Category and permissions are often compared and grouped
+        if isinstance(cls.category, str):
+            cls.category = sys.intern(cls.category)
+
+        if isinstance(cls.permissions, str):
+            cls.permissions = sys.intern(cls.permissions)
+
     @staticmethod
-    def _explore_for(path: Path, names: Sequence[str]):
+    def _explore_for(path: Path, names: Sequence[str]) -> Tuple[Any, ...]:
         """Explore for the given variable names."""
         values = [NOT_SET] * len(names)
-        current = path
-        while str(current) != '.':
-            if current.parts[-1].endswith(".py"):
-                current = current.parent / current.stem
-
-            pypath = ".".join(current.parts)
-            module = import_module(pypath)
+        parts = list(path.parts)
+        if parts and parts[-1].endswith(".py"):
+            parts[-1] = parts[-1][:-3]
+
+        # Python paths of the module and its parent packages
+        pypaths = [".".join(parts[:i]) for i in range(len(parts), 0, -1)]
+        for pypath in pypaths:
+            module = None
             for i, name in enumerate(names):
                 if values[i] is not NOT_SET:
                     continue
 
-                value = getattr(module, name, NOT_SET)
+                # Sibling commands share the same parent packages
+                key = (pypath, name)
+                value = EXPLORED.get(key)
+                if key not in EXPLORED:
+                    module = module or import_module(pypath)
+                    value = getattr(module, name, NOT_SET)
+                    EXPLORED[key] = value
+
                 if value is not NOT_SET:
                     values[i] = value
 
             if not any(value is NOT_SET for value in values):
                 return tuple(values)
 
-            current = current.parent
-
         # Some values couldn't be found in parent directories
         for i, value in enumerate(values):
             if value is NOT_SET:
@@ -33,15 +33,18 @@ import asyncio
 from collections import defaultdict
 from importlib import import_module
 from pathlib import Path
-from typing import Dict, Optional
+from pkgutil import iter_modules
+from typing import Dict, Iterator, Optional, Set
 
-from command.base import Command, logger
+from command.base import COMMANDS_BY_MODULE, Command, logger
 from command.log import logger
 from command.special.exit import ExitCommand
 import settings
 
 # Constants
 COMMANDS_BY_LAYERS = defaultdict(dict)
+DISPATCH_TABLES = {}
+LAYER_COMMANDS = {}
 LAYERS = {}
 
 class MetaCommandLayer(type):
@@ -79,12 +82,14 @@ class CommandLayer(metaclass=MetaCommandLayer):
 
     def __init__(self, character=None):
         self.character = character
-        self.commands = []
+        self.commands = ()
+        self.dispatch = {}
 
     def __getstate__(self):
         """Return what to pickle."""
         to_save = dict(self.__dict__)
         del to_save["commands"]
+        del to_save["dispatch"]
         return to_save
 
     def __setstate__(self, saved):
@@ -92,6 +97,7 @@ class CommandLayer(metaclass=MetaCommandLayer):
         self.__dict__.update(saved)
         layer = self.load(self.character)
         self.commands = layer.commands
+        self.dispatch = layer.dispatch
 
     def handle_input(self, command: str) -> Optional[Command]:
         """
@@ -127,30 +133,56 @@ class CommandLayer(metaclass=MetaCommandLayer):
 
         """
         character = self.character
-        seps = {sep: () for comm in self.commands for sep in comm.seps}
-        for sep in seps.keys():
-            try:
-                before, after = command.split(sep, 1)
-            except ValueError:
-                before = command
-                after = ""
+        candidates = []
+        for sep, names in self.dispatch.items():
+            before, _, after = command.partition(sep)
+            for order, match in names.get(before, ()):
+                candidates.append((order, sep, after, match))
+
+        # Commands are tried in the order they have in the layer
+        candidates.sort(key=lambda candidate: candidate[0])
+        for _, sep, after, match in candidates:
+            if character and not match.can_run(character):
+                continue
+
+            return match(character, sep, after)
+
+        return None
+
+    def update_dispatch(self) -> None:
+        """
+        Update the dispatch table, used to find commands by name.
 
-            seps[sep] = (before, after)
+        The dispatch table is a dictionary of separators.  Each
+        separator is linked to a dictionary of names (command
+        names and aliases) with, as value, the list of matching
+        commands and their order in the layer.
 
-        for command in self.commands:
+        This method should be called when the list of commands
+        has changed.  Layers with the same commands share
+        the same dispatch table.
+
+        """
+        commands = tuple(self.commands)
+        if (dispatch := DISPATCH_TABLES.get(commands)) is not None:
+            self.dispatch = dispatch
+            return
+
+        dispatch = {}
+        for position, command in enumerate(self.commands):
             aliases = command.alias
             if isinstance(aliases, str):
                 aliases = (aliases, )
 
-            for sep in command.seps:
-                before, after = seps[sep]
-                if before == command.name or before in aliases:
-                    if character and not command.can_run(character):
-                        continue
+            names = {command.name, *aliases}
+            for sep_position, sep in enumerate(command.seps):
+                by_name = dispatch.setdefault(sep, {})
+                for name in names:
+                    by_name.setdefault(name, []).append(
+                            ((position, sep_position), command))
 
-                    return command(character, sep, after)
-
-        return None
+        DISPATCH_TABLES[commands] = dispatch
+        self.dispatch = dispatch
 
     def cannot_find(self, command: str) -> str:
         """
@@ -172,18 +204,26 @@ class CommandLayer(metaclass=MetaCommandLayer):
         Usually you don't need to override this in your dynamic command
         layer.  However, if you want to add other, non-dynamic
         commands to your command layer, you can do so here.
-        The added commands should find themselves in the list
+        The added commands should find themselves in the sequence
         (`self.commands`), and should inherit the `Command` class,
-        or be close enough (duck-typing).
+        or be close enough (duck-typing).  By default, this sequence
+        is a tuple shared by all layers of the same name, so create
+        a new sequence rather than modifying it.
 
         """
-        self.commands = list(COMMANDS_BY_LAYERS.get(self.name, {}).values())
+        commands = LAYER_COMMANDS.get(self.name)
+        if commands is None:
+            commands = tuple(COMMANDS_BY_LAYERS.get(self.name, {}).values())
+            LAYER_COMMANDS[self.name] = commands
+
+        self.commands = commands
 
     @classmethod
     def load(cls, character):
         """Load the command layer for this character."""
         layer = cls(character)
         layer.load_commands()
+        layer.update_dispatch()
         return layer
 
 
@@ -248,14 +288,15 @@ def load_commands(condition: asyncio.Condition,
 
     """
     Command.condition = condition
+    LAYER_COMMANDS.clear()
     parent_dir = Path("command")
-    exclude = [
-        parent_dir / "args",
-        parent_dir / "special",
-        parent_dir / "base.py",
-        parent_dir / "log.py",
-        parent_dir / "layer.py",
-    ]
+    exclude = {
+        "command.args",
+        "command.special",
+        "command.base",
+        "command.log",
+        "command.layer",
+    }
 
     can_contain = (parent_dir, )
     plugins_path = Path("plugins")
@@ -264,54 +305,70 @@ def load_commands(condition: asyncio.Condition,
     logger.debug("Loading the commands...")
     how_many = 0
     for parent in can_contain:
-        for path in parent.rglob("*.py"):
-            if path in exclude:
+        prefix = ".".join(parent.parts) + "."
+        for pypath in _walk_modules(parent, prefix, exclude):
+            parts = pypath.split(".")
+            path = Path(*parts[:-1], parts[-1] + ".py")
+            if parts[-1].startswith("_"):
+                logger.debug("  The commands in {} are ignored.", path)
                 continue
 
-            if any(to_ex in path.parents for to_ex in exclude):
-                continue
-
-            if path.name.startswith("_"):
-                if path.stem != "__init__": # No point in logging __init__ files
-                    logger.debug(f"  The commands in {path} are ignored.")
-                continue
-
-            # Assume this is a module containing a command
-            relative = path.relative_to(parent)
-            pypath = ".".join(path.parts)[:-3]
-
             # Try to import
             try:
                 module = import_module(pypath)
             except Exception:
-                logger.exception("  An error occurred when "
-                        f"importing {pypath}")
+                logger.exception("  An error occurred when importing {}",
+                        pypath)
                 if raise_exception:
                     raise
 
                 continue
 
-            # Explore the module for command classes
+            # Command classes have been registered when defined
             cmds_in_module = 0
-            for key, value in module.__dict__.items():
-                if value is not Command and isinstance(value,
-                        type) and issubclass(value, Command):
-                    command = value
-                    command.extrapolate(path)
-                    COMMANDS_BY_LAYERS[command.layer][command.name] = command
-                    logger.debug(f"  Succesfully loaded "
-                            f"{command.__module__}.{command.__name__} "
-                            f"(layer={command.layer})")
-                    cmds_in_module += 1
-                    how_many += 1
+            for command in COMMANDS_BY_MODULE.get(module.__name__, ()):
+                command.extrapolate(path)
+                COMMANDS_BY_LAYERS[command.layer][command.name] = command
+                logger.debug("  Succesfully loaded {}.{} (layer={})",
+                        command.__module__, command.__name__, command.layer)
+                cmds_in_module += 1
+                how_many += 1
 
             if cmds_in_module == 0:
-                logger.warning("  No command was found in "
-                        f"the {pypath} module")
+                logger.warning("  No command was found in the {} module",
+                        pypath)
 
     s = "s" if how_many > 1 else ""
     were = "were" if how_many > 1 else "was"
-    logger.debug(f"{how_many} command{s} {were} succesfully loaded")
+    logger.debug("{} command{} {} succesfully loaded", how_many, s, were)
+
+def _walk_modules(parent: Path, prefix: str,
+        exclude: Set[str]) -> Iterator[str]:
+    """
+    Yield the dotted names of the modules in a directory, recursively.
+
+    Contrary to `pkgutil.walk_packages`, packages are not imported
+    to find their submodules, so import errors only occur when
+    the modules are imported by `load_commands`.
+
+    Args:
+        parent (Path): the directory to explore.
+        prefix (str): the prefix of the module names.
+        exclude (set): the modules and packages to skip.
+
+    Yields:
+        pypath (str): the dotted name of a module.
+
+    """
+    for _, pypath, is_package in iter_modules([str(parent)], prefix):
+        if pypath in exclude:
+            continue
+
+        if is_package:
+            name = pypath.rpartition(".")[2]
+            yield from _walk_modules(parent / name, pypath + ".", exclude)
+        else:
+            yield pypath
 
 def find_command(name: str, layer: Optional[str] = "static"):
     """
@@ -70,6 +70,15 @@ class CreatePassword(SessionContext):
             )
             return
 
+        # Check that the password isn't too long
+        if len(password) > settings.MAX_PASSWORD:
+            await self.msg(
+                f"This password is incorrect.  It should be "
+                f"at most {settings.MAX_PASSWORD} characters long.  "
+                "Please try again."
+            )
+            return
+
         await self.msg("You selected a password. Great!")
         self.session.options["password"] = password
         await self.move("account.confirm_password")
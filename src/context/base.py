@@ -135,6 +135,13 @@ class BaseContext(metaclass=ABCMeta):
     prompt = ""
     text = ""
 
+    def __init_subclass__(cls, **kwargs):
+        """Dedent the context text once, when the class is created."""
+        super().__init_subclass__(**kwargs)
+        text = cls.__dict__.get("text")
+        if isinstance(text, str):
+            cls.text = dedent(text.strip("\n"))
+
     def __str__(self):
         return self.pyname
 
@@ -159,7 +166,8 @@ class BaseContext(metaclass=ABCMeta):
         await type(self).condition.mark_as_running(self)
         text = await self.greet()
         if text is not None:
-            if isinstance(text, str):
+            # The class text has already been dedented
+            if isinstance(text, str) and text is not self.text:
                 text = dedent(text.strip("\n"))
 
             await self.msg(text)
@@ -50,6 +50,22 @@ class MOTD(SessionContext):
           |_| \___/__/ \__||_|_||_|\__, |   /_/ \_\|_||_|
                                    |___/
     """
+    encoded = None
+
+    async def greet(self):
+        """
+        Return the encoded text.
+
+        The text only contains ASCII characters, which are encoded
+        the same way by the encodings sessions use.  It is encoded once,
+        then sent as is to every new connection.
+
+        """
+        cls = type(self)
+        if cls.encoded is None:
+            cls.encoded = cls.text.encode("ascii")
+
+        return cls.encoded
 
     async def refresh(self):
         """Leave this context at once."""
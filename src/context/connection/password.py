@@ -29,7 +29,10 @@
 
 """Account password context."""
 
+import asyncio
+
 from context.session_context import SessionContext
+import settings
 
 class Password(SessionContext):
 
@@ -62,7 +65,17 @@ class Password(SessionContext):
             )
             return
 
-        if account.is_correct_password(password):
+        # Don't hash overly long passwords, no valid password is that long
+        if len(password) > settings.MAX_PASSWORD:
+            correct = False
+        else:
+            # Hashing the password is slow by design, do it in a thread.
+            # Entities can't be used outside of the main thread, so
+            # the hashed password is read here.
+            loop = asyncio.get_running_loop()
+            correct = await loop.run_in_executor(None, account.test_password,
+                    account.hashed_password, password)
+        if correct:
             await self.msg("Correct password!")
             _ = account.options.pop("wrong_password", None)
             self.session.account = account
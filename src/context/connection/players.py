@@ -35,31 +35,53 @@ from context.session_context import SessionContext
 from data.base import db
 import settings
 
+# Constants
+HEADER = dedent("""
+    Welcome to your account, {username}!
+
+    You can select your players here.  Enter a number to
+    play one of these characters or the letter 'c' to create a new one.
+
+    Available characters:
+    """.strip("\n"))
+FOOTER = dedent("""
+    Type 'c' to create a new player.
+    """.strip("\n"))
+
 class Players(SessionContext):
 
     """Context to display the account's players."""
 
-    async def greet(self):
-        """Display the players' screen."""
-        account = self.session.account
-        screen = dedent(f"""
-            Welcome to your account, {account.username}!
+    def __init__(self, session):
+        super().__init__(session)
+        self._players = None
 
-            You can select your players here.  Enter a number to
-            play one of these characters or the letter 'c' to create a new one.
+    @property
+    def players(self):
+        """
+        Return the account's players, sorted by creation date.
 
-            Available characters:
-        """.strip("\n"))
+        The list is queried only once for this context.  A new
+        context is created each time the session enters it, so
+        newly-created players will appear.
 
-        for i, player in enumerate(
-                account.players.sort_by(db.Player.created_on)):
-            screen += f"\n  {i + 1} to play {player.name}"
+        """
+        if self._players is None:
+            account = self.session.account
+            self._players = list(
+                    account.players.sort_by(db.Player.created_on))
 
-        screen += "\n\n" + dedent("""
-            Type 'c' to create a new player.
-        """.strip("\n"))
+        return self._players
 
-        return screen
+    async def greet(self):
+        """Display the players' screen."""
+        account = self.session.account
+        lines = [HEADER.format(username=account.username)]
+        lines.extend(f"\n  {i + 1} to play {player.name}"
+                for i, player in enumerate(self.players))
+        lines.append("\n\n" + FOOTER)
+
+        return "".join(lines)
 
     async def input_c(self):
         """The user has entered 'c'."""
@@ -67,13 +89,15 @@ class Players(SessionContext):
 
     async def input(self, command: str):
         """Expecting a player number."""
-        account = self.session.account
-        command = command.lower().strip()
-        for i, player in enumerate(
-                account.players.sort_by(db.Player.created_on)):
-            if str(i + 1) == command:
-                self.session.options["player"] = player
-                await self.move("connection.login")
-                return
+        try:
+            index = int(command.strip()) - 1
+        except ValueError:
+            index = -1
+
+        players = self.players
+        if 0 <= index < len(players):
+            self.session.options["player"] = players[index]
+            await self.move("connection.login")
+            return
 
         await self.msg("Invalid command.")
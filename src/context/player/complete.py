@@ -57,6 +57,16 @@ class Complete(SessionContext):
             await self.move("player.name")
             return
 
+        # Check that the name isn't already used, this is cheaper
+        # than failing to create the player
+        if db.Player.exists(name=name):
+            await self.msg(
+                f"A character named {name} already exists.  Please "
+                "choose another name."
+            )
+            await self.move("player.name")
+            return
+
         # Attempt to create the player
         try:
             player = db.Player(name=name, account=self.session.account)
@@ -40,15 +40,15 @@ is useful (no need to put passwords in characters, after all).
 
 from datetime import datetime
 import hashlib
+import hmac
 import os
-import pickle
 import typing as ty
 
 from pony.orm import Optional, Required, Set
 
 from data.base import db, PicklableEntity
 from data.decorators import lazy_property
-from data.handlers import BlueprintHandler, OptionHandler
+from data.handlers import EMPTY_OPTIONS, BlueprintHandler, OptionHandler
 import settings
 
 class Account(PicklableEntity, db.Entity):
@@ -63,7 +63,7 @@ class Account(PicklableEntity, db.Entity):
     sessions = Set("Session")
     web_sessions = Set("WebSession")
     players = Set("Player")
-    binary_options = Required(bytes, default=pickle.dumps({}))
+    binary_options = Required(bytes, default=EMPTY_OPTIONS)
 
     @lazy_property
     def blueprints(self):
@@ -156,6 +156,5 @@ class Account(PicklableEntity, db.Entity):
     def test_password(hashed_password: bytes, plain_password: str) -> bool:
         """Return whether the hashed and non hashed password match."""
         salt = hashed_password[:settings.SALT_SIZE]
-        key = hashed_password[settings.SALT_SIZE:]
         hashed_attempt = Account.hash_password(plain_password, salt)
-        return hashed_password == hashed_attempt
+        return hmac.compare_digest(hashed_password, hashed_attempt)
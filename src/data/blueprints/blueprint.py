@@ -38,6 +38,7 @@ report back to whatever function called it.
 
 """
 
+from bisect import insort
 from typing import Any, Dict, Sequence
 
 from data.blueprints.document import create, create_from_object
@@ -57,7 +58,9 @@ class Blueprint:
 
         # Document types
         self.rooms = {} # {barcode: document}
+        self.barcodes = [] # sorted room barcodes, to search by prefix
         self.coords = {} # {(x, y, z): document}
+        self.coords_by_z = {} # {z: {(x, y): document}}
 
         for i, document in enumerate(self.documents):
             document = self.create_document(document)
@@ -147,11 +150,14 @@ class Blueprint:
     def handle_room(self, document):
         """Handle the room document."""
         with document.cleaned as room:
+            if room.barcode not in self.rooms:
+                insort(self.barcodes, room.barcode)
             self.rooms[room.barcode] = document
             if all(data is not None for data in (
                     room.x, room.y, room.z)):
                 x, y, z = room.x, room.y, room.z
                 self.coords[(x, y, z)] = document
+                self.coords_by_z.setdefault(z, {})[(x, y)] = document
 
     def register(self):
         """Register all stored documents."""
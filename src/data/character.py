@@ -67,7 +67,7 @@ class Character(CanBeNamed, PicklableEntity, db.Entity):
     def permissions(self):
         return PermissionHandler(self)
 
-    @lazy_property
+    @property
     def location(self):
         return self.locator.get()
 
@@ -34,6 +34,6 @@ from data.handlers.blueprints import BlueprintHandler
 from data.handlers.description import DescriptionHandler
 from data.handlers.location import LocatorHandler
 from data.handlers.name import NameHandler
-from data.handlers.options import OptionHandler
+from data.handlers.options import EMPTY_OPTIONS, OptionHandler
 from data.handlers.permissions import PermissionHandler
 from data.handlers.tags import TagHandler
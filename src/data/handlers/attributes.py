@@ -32,19 +32,37 @@
 import pickle
 import typing as ty
 
-from pony.orm import PrimaryKey, Required, commit, exists, select
+from pony.orm import PrimaryKey, Required, commit, select
 
 from data.base import db
 
 NOT_SET = object()
 
+# Names stored on the handler itself, not as attributes
+INTERNAL_NAMES = frozenset((
+    "_AttributeHandler__cache",
+    "_AttributeHandler__owner",
+    "_AttributeHandler__object_class",
+    "_AttributeHandler__object_id",
+))
+
 class AttributeHandler:
 
-    """Attribute handler."""
+    """
+    Attribute handler.
+
+    Unpickled values are cached in the handler, so reading the same
+    attribute again doesn't need to query and unpickle it.  Modifying
+    a value in place doesn't store it: set the attribute again to
+    update the database (and the cache).
 
+    """
+
+    __slots__ = ("__cache", "__owner", "__object_class", "__object_id")
     subset = "attribute"
 
     def __init__(self, owner):
+        self.__cache = {}
         self.__owner = owner
         self.__object_class = owner.__class__.__name__
         if owner.id is None:
@@ -53,28 +71,32 @@ class AttributeHandler:
 
     def __getattr__(self, name):
         """Return the attribute value or raises AttributeError."""
-        return self._get_attribute_of_name(name).value
+        return self.get(name)
 
     def __setattr__(self, name, value):
-        if name.startswith("_"):
+        if name in INTERNAL_NAMES:
             super().__setattr__(name, value)
         else:
+            pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
             attr = self._get_attribute_of_name(name, default=None)
             if attr:
-                attr.pickled = pickle.dumps(value)
+                attr.pickled = pickled
             else:
                 Attribute(subset=self.subset, object_class=self.__object_class,
                         object_id=self.__object_id, name=name,
-                        pickled=pickle.dumps(value))
+                        pickled=pickled)
+
+            self.__cache[name] = value
 
     def __delattr__(self, name):
         """Remove this attribute."""
-        if name.startswith("_"):
+        if name in INTERNAL_NAMES:
             super().__delattr__(name)
         else:
             attr = self._get_attribute_of_name(name, default=None)
             if attr:
                 attr.delete()
+                self.__cache.pop(name, None)
             else:
                 raise ValueError("this attribute doesn't exist")
 
@@ -84,8 +106,7 @@ class AttributeHandler:
 
     def __contains__(self, name):
         """Return whether this instance contains the named attribute."""
-        return exists(attr for attr in self._get_all_attributes()
-                if attr.name == name)
+        return self._get_attribute_of_name(name, default=None) is not None
 
     def __len__(self):
         """Return the number of stored attributes for this instance."""
@@ -106,8 +127,19 @@ class AttributeHandler:
             value or default: the value of the attribute, or default.
 
         """
-        return self._get_attribute_of_name(attribute, default=default,
-                value=True)
+        cache = self.__cache
+        if attribute in cache:
+            return cache[attribute]
+
+        attr = self._get_attribute_of_name(attribute, default=None)
+        if attr is None:
+            if default is NOT_SET:
+                raise ValueError("uknown attribute")
+
+            return default
+
+        value = cache[attribute] = attr.value
+        return value
 
     def _get_all_attributes(self):
         """Return the attributes for this object."""
@@ -118,13 +150,15 @@ class AttributeHandler:
 
     def _get_attribute_of_name(self, name, default=NOT_SET, value=False):
         """Return the attribute of this name, or raise an exception."""
-        result = select(attr for attr in self._get_all_attributes()
-                if attr.name == name)[:]
-        if result:
+        # The name is part of the primary key, so Pony can use its cache
+        attr = Attribute.get(subset=self.subset,
+                object_class=self.__object_class,
+                object_id=self.__object_id, name=name)
+        if attr is not None:
             if value:
-                return result[0].value
+                return attr.value
 
-            return result[0]
+            return attr
 
         if default is not NOT_SET:
             return default
@@ -46,6 +46,7 @@ class BlueprintHandler(TagHandler):
 
     """Blueprint handler, using a tag handler behind the scenes."""
 
+    __slots__ = ()
     subset = "blueprint"
     current_parser = None
 
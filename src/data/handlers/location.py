@@ -59,19 +59,20 @@ class LocatorHandler:
 
     def get(self):
         """Retrieve the location of the owner."""
-        if (cached := LOCATIONS.get(self._owner)):
-            return cached
+        # Objects without location are cached as well
+        owner = self._owner
+        if owner in LOCATIONS:
+            return LOCATIONS[owner]
 
+        location = None
         locator = Location.get(object_class=self._object_class,
                 object_id=self._object_id)
         if locator:
             Entity = getattr(db, locator.location_class)
             location = Entity[locator.location_id]
-            if location:
-                LOCATIONS[self._owner] = location
-            return location
 
-        return None
+        LOCATIONS[owner] = location
+        return location
 
     def set(self, location):
         """
@@ -93,24 +94,20 @@ class LocatorHandler:
             max_index = max_index or 0
             type(self).max_index = max_index
 
-        # Check the location recursively.
-        # It might be possible to optimize it.  As it stands, we need
-        # to iterate over locations, not ideal, though acceptable with
-        # a limited depth set of data.
-        if location is not None:
-            object_class, object_id = type(location).__name__, location.id
-            while object_class:
-                if (object_class == self._object_class and
-                        object_id == self._object_id):
-                    raise RecursionError
-
-                t_location = Location.get(object_class=object_class,
-                        object_id=object_id)
-                if t_location:
-                    object_class = t_location.location_class
-                    object_id = t_location.location_id
-                else:
-                    break
+        # Check the location recursively.  Locations are cached
+        # (see `get`), so only the first move of an object should
+        # query the locations of its new parents.
+        current = location
+        while current is not None:
+            if (type(current).__name__ == self._object_class and
+                    current.id == self._object_id):
+                raise RecursionError
+
+            locator = getattr(current, "locator", None)
+            if locator is None:
+                break
+
+            current = locator.get()
 
         old_location = self.get()
         locator = Location.get(object_class=self._object_class,
@@ -118,11 +115,10 @@ class LocatorHandler:
         if locator:
             if location is None:
                 locator.delete()
-                return
-
-            locator.location_class = type(location).__name__
-            locator.location_id = location.id
-            locator.index = type(self).max_index + 1
+            else:
+                locator.set(location_class=type(location).__name__,
+                        location_id=location.id,
+                        index=type(self).max_index + 1)
         elif location is not None:
             Location(object_class=self._object_class,
                     object_id=self._object_id,
@@ -138,21 +134,21 @@ class LocatorHandler:
             if self._owner in old_contents:
                 old_contents.remove(self._owner)
         if location:
-            new_contents = CONTENTS.get(location, [])
-            if not new_contents:
-                CONTENTS[location] = new_contents
-            new_contents.append(self._owner)
+            # Only update contents that have already been queried
+            new_contents = CONTENTS.get(location)
+            if new_contents is not None:
+                new_contents.append(self._owner)
 
     def contents(self):
         """Return the contents of the owner, sorted by index."""
-        location = self.get()
-        cached = CONTENTS.get(location, None)
+        cached = CONTENTS.get(self._owner)
         if cached is not None:
-            return cached
+            return list(cached)
 
         contents = select(location for location in Location
                 if location.location_class == self._object_class and
-                location.location_id == self._object_id)
+                location.location_id == self._object_id).order_by(
+                Location.index)
         object_classes = defaultdict(list)
         indice = 0
         indices = {}
@@ -169,7 +165,8 @@ class LocatorHandler:
                 index = indices[(type(obj), obj.id)]
                 objects[index] = obj
 
-        return objects
+        CONTENTS[self._owner] = objects
+        return list(objects)
 
 
 class Location(db.Entity):
@@ -181,6 +178,7 @@ class Location(db.Entity):
     composite_index(object_class, object_id)
     location_class = Required(str)
     location_id = Required(int)
+    composite_index(location_class, location_id)
     index = Required(int, unique=True)
 
     @property
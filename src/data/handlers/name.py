@@ -57,6 +57,7 @@ class NameHandler(TagHandler):
 
     """Name handler, using a tag handler behind the scenes."""
 
+    __slots__ = ("common", )
     subset = "name"
 
     def __init__(self, owner):
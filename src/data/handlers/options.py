@@ -35,10 +35,20 @@ entity it modifies.
 
 """
 
+import asyncio
 import pickle
 
 from collections.abc import MutableMapping
 
+# Pickled empty options, the default for all entities
+EMPTY_OPTIONS = pickle.dumps({}, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Types whose values can't be modified in place
+IMMUTABLE_TYPES = (bool, bytes, float, int, str, type(None))
+
+# Marker for missing options
+_MISSING = object()
+
 class OptionHandler(MutableMapping):
 
     """Option handler, to handle options in a dictionary-like object.
@@ -57,15 +67,30 @@ class OptionHandler(MutableMapping):
         ''
         >>> # ...
 
+    Options are not pickled each time they are modified: when an
+    event loop is running, they are pickled once, at the end of the
+    current iteration of the loop.  Call `save` to store them at once,
+    or `save_pending` to store the options of all handlers waiting
+    to be saved (this should be done before closing the database
+    session).
+    Setting an option to the immutable value it already has doesn't
+    pickle the options again.
+
     """
 
     __slots__ = ("__owner", "__binary_field", "__options")
 
+    # Handlers waiting to be saved, by ID (mappings can't be hashed)
+    _pending = {}
+
     def __init__(self, owner, binary_field="binary_options"):
         self.__owner = owner
         self.__binary_field = binary_field
         binary = getattr(owner, binary_field)
-        self.__options = pickle.loads(binary)
+        if binary == EMPTY_OPTIONS:
+            self.__options = {}
+        else:
+            self.__options = pickle.loads(binary)
 
     def __len__(self):
         return len(self.__options)
@@ -77,11 +102,50 @@ class OptionHandler(MutableMapping):
         return self.__options[key]
 
     def __setitem__(self, key, value):
+        old = self.__options.get(key, _MISSING)
+        if (type(old) is type(value) and isinstance(value, IMMUTABLE_TYPES)
+                and old == value):
+            return
+
         self.__options[key] = value
-        setattr(self.__owner, self.__binary_field, pickle.dumps(
-                self.__options))
+        self._schedule_save()
 
     def __delitem__(self, key):
         del self.__options[key]
-        setattr(self.__owner, self.__binary_field, pickle.dumps(
-                self.__options))
+        self._schedule_save()
+
+    def save(self):
+        """Pickle the options and store them in the owner."""
+        type(self)._pending.pop(id(self), None)
+        if self.__options:
+            binary = pickle.dumps(self.__options,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            binary = EMPTY_OPTIONS
+
+        setattr(self.__owner, self.__binary_field, binary)
+
+    def _schedule_save(self):
+        """Save the options when the event loop is free."""
+        pending = type(self)._pending
+        if id(self) in pending:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+        else:
+            pending[id(self)] = self
+            loop.call_soon(self._save_if_pending)
+
+    def _save_if_pending(self):
+        """Save the options, unless they have been saved already."""
+        if id(self) in type(self)._pending:
+            self.save()
+
+    @classmethod
+    def save_pending(cls):
+        """Save the options of all handlers waiting to be saved."""
+        for handler in tuple(cls._pending.values()):
+            handler.save()
@@ -35,10 +35,117 @@ from data.handlers.tags import TagHandler
 
 class PermissionHandler(TagHandler):
 
-    """Permission handler, using a tag handler behind the scenes."""
+    """
+    Permission handler, using a tag handler behind the scenes.
 
+    Permissions are often checked (each time a command is run,
+    for instance), so the permission names of the object are
+    queried once and kept in memory.
+
+    """
+
+    __slots__ = ("__names", )
     subset = "permission"
 
+    def __init__(self, owner):
+        super().__init__(owner)
+        self.__names = None
+
+    def __contains__(self, name):
+        """Return whether this object has this permission."""
+        return name in self._get_names()
+
+    def has(self, name, category=None):
+        """
+        Return whether this object has this permission.
+
+        Args:
+            name (str): the name of the permission.
+            category (str, optional): the category.
+
+        Returns:
+            has (bool): whether this object has this permission.
+
+        """
+        if category or self.category:
+            return super().has(name, category)
+
+        return name in self._get_names()
+
+    def has_any(self, names: ty.Iterable[str]) -> bool:
+        """
+        Return whether this object has at least one of these permissions.
+
+        Prefer this method to calling `has` for each permission.
+
+        Args:
+            names (iterable of str): the names of the permissions.
+
+        Returns:
+            has (bool): whether this object has any of these permissions.
+
+        """
+        return not self._get_names().isdisjoint(names)
+
+    def has_all(self, names: ty.Iterable[str]) -> bool:
+        """
+        Return whether this object has all these permissions.
+
+        Prefer this method to calling `has` for each permission.
+
+        Args:
+            names (iterable of str): the names of the permissions.
+
+        Returns:
+            has (bool): whether this object has all these permissions.
+
+        """
+        return self._get_names().issuperset(names)
+
+    def add(self, name, category=None):
+        """
+        Add a permission to this object.
+
+        If this object already has this permission, do nothing.
+
+        Args:
+            name (str): the name of the permission.
+            category (str, optional): the category.
+
+        """
+        super().add(name, category)
+        if self.__names is not None:
+            self.__names.add(name)
+
+    def remove(self, name, category=None):
+        """
+        Remove a permission from this object.
+
+        Args:
+            name (str): the name of the permission.
+            category (str, optional): the category.
+
+        Raises:
+            ValueError: this object doesn't have this permission.
+
+        """
+        super().remove(name, category)
+
+        # The same name might still be present in another category
+        self.__names = None
+
+    def clear(self, category=None):
+        """
+        Remove all permissions from this object.
+
+        Args:
+            category (str, optional): only remove permissions
+                    of this category.
+
+        """
+        super().clear(category)
+        self.__names = None
+
     def get(self):
         """Return the permissions in a space-separated string."""
         return " ".join([link.tag.name for link in self])
@@ -61,3 +168,10 @@ class PermissionHandler(TagHandler):
 
         """
         return super().search(name, category)
+
+    def _get_names(self):
+        """Return the set of permission names, querying it if needed."""
+        if self.__names is None:
+            self.__names = {link.tag.name for link in self}
+
+        return self.__names
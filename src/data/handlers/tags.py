@@ -44,6 +44,7 @@ class TagHandler:
 
     """Tag handler."""
 
+    __slots__ = ("__owner", "__object_class", "__object_id")
     subset = "tag"
     category = None
 
@@ -83,7 +84,7 @@ class TagHandler:
 
         """
         category = self.category or category
-        return self._get_tag_of_name(name, category, default=None) is not None
+        return self._get_tag_query(name, category).exists()
 
     def add(self, name, category=None):
         """
@@ -132,7 +133,7 @@ class TagHandler:
 
         tag = link.tag
         link.delete()
-        if len(tag.links) == 0:
+        if tag.links.is_empty():
             tag.delete()
 
     def clear(self, category=None):
@@ -196,18 +197,20 @@ class TagHandler:
 
     def _get_tag_of_name(self, name, category=None, default=NOT_SET):
         """Return the tag of this name, or raise an exception."""
-        subset = self.subset
-        category = self.category or category
-        result = select(link for link in self._get_all_tags(category)
-                if link.tag.name == name)[:]
-        if result:
-            return result[0]
+        link = self._get_tag_query(name, category).first()
+        if link is not None:
+            return link
 
         if default is not NOT_SET:
             return default
 
         raise ValueError("uknown tag")
 
+    def _get_tag_query(self, name, category=None):
+        """Return the query to select the links to the named tag."""
+        return select(link for link in self._get_all_tags(category)
+                if link.tag.name == name)
+
     @classmethod
     def _get_search_query(cls, category=None):
         query = select(tag for tag in Tag if tag.subset == cls.subset)
@@ -218,17 +221,18 @@ class TagHandler:
 
     @classmethod
     def _get_opbjects_from_query(cls, query):
+        # Query the links of all matching tags at once
         object_classes = defaultdict(set)
-        for tag in query:
-            for link in tag.links:
-                Entity = getattr(db, link.object_class)
-                object_classes[Entity].add(link.object_id)
+        tags = tuple(query)
+        links = select(link for link in TagLink if link.tag in tags)
+        for link in links:
+            object_classes[link.object_class].add(link.object_id)
 
-        # Retrieve the tagged objects
+        # Retrieve the tagged objects, looking up each entity class once
         objects = []
-        for Entity, ids in object_classes.items():
-            for obj in select(obj for obj in Entity if obj.id in ids):
-                objects.append(obj)
+        for object_class, ids in object_classes.items():
+            Entity = getattr(db, object_class)
+            objects.extend(select(obj for obj in Entity if obj.id in ids))
 
         # Sort objects by their location index, if they have any
         missing = []
@@ -264,6 +268,7 @@ class Tag(db.Entity):
     category = Optional(str)
     subset = Required(str)
     composite_index(name, category, subset)
+    composite_index(subset, category)
     links = Set("TagLink")
 
 
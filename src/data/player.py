@@ -46,7 +46,7 @@ class Player(Character):
 
     """Playing Character (PC)."""
 
-    name = Required(str)
+    name = Required(str, unique=True)
     account = Required("Account")
     created_on = Required(datetime, default=datetime.utcnow)
     binary_context_stack = Optional(bytes)
@@ -76,7 +76,7 @@ class Room(PicklableEntity, db.Entity):
     def locator(self):
         return LocatorHandler(self)
 
-    @lazy_property
+    @property
     def location(self):
         return self.locator.get()
 
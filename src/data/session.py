@@ -30,7 +30,8 @@
 """Session entity."""
 
 import asyncio
-import pickle
+import codecs
+from functools import lru_cache
 import typing as ty
 from uuid import UUID, uuid4
 
@@ -39,7 +40,7 @@ from pony.orm import Optional, PrimaryKey, Required, Set
 from context.base import CONTEXTS
 from data.base import db, PicklableEntity
 from data.decorators import lazy_property
-from data.handlers import OptionHandler
+from data.handlers import EMPTY_OPTIONS, OptionHandler
 import settings
 
 # Asynchronous queue of all session output messages
@@ -48,6 +49,29 @@ OUTPUT = {
 }
 CMDS_TO_PORTAL = asyncio.Queue()
 
+@lru_cache(maxsize=32)
+def get_encoder(encoding: str) -> ty.Callable:
+    """
+    Return the encoding function of a text encoding.
+
+    The codecs of recently used encoding names are kept, the cache
+    is bounded since the encoding name is chosen by the client.  If
+    the encoding doesn't exist, or isn't a text encoding, utf-8 is used.
+
+    Args:
+        encoding (str): the encoding name.
+
+    Returns:
+        encode (callable): the codec's encoding function.
+
+    """
+    try:
+        "".encode(encoding)
+    except LookupError:
+        encoding = "utf-8"
+
+    return codecs.lookup(encoding).encode
+
 class Session(PicklableEntity, db.Entity):
 
     """
@@ -73,7 +97,7 @@ class Session(PicklableEntity, db.Entity):
     context_path = Required(str)
     account = Optional("Account")
     character = Optional("Character")
-    binary_options = Required(bytes, default=pickle.dumps({}))
+    binary_options = Required(bytes, default=EMPTY_OPTIONS)
 
     @lazy_property
     def context(self):
@@ -131,12 +155,7 @@ class Session(PicklableEntity, db.Entity):
         """
         if isinstance(text, str):
             encoding = self.options.get("encoding", settings.DEFAULT_ENCODING)
-            try:
-                encoded = text.encode(encoding, errors="replace")
-            except LookupError:
-                # Use utf-8 as a default
-                encoding = "utf-8"
-                encoded = text.encode(encoding, errors="replace")
+            encoded, _ = get_encoder(encoding)(text, "replace")
         else:
             encoded = text
 
@@ -145,7 +164,8 @@ class Session(PicklableEntity, db.Entity):
         except KeyError:
             queue = OUTPUT["unknown"]
 
-        await queue.put(encoded)
+        # Output queues are unbounded, putting never has to wait
+        queue.put_nowait(encoded)
 
     async def msg_portal(self, cmd_name: str, args: ty.Optional[dict] = None):
         """
@@ -39,10 +39,28 @@ from subprocess import Popen, DEVNULL, PIPE, run
 import sys
 from typing import Tuple
 
+# Operating system, it can't change while the process runs
+_IS_WINDOWS = platform.system() == "Windows"
+
 # Import wintypes if on Windows
-if platform.system() == "Windows":
+if _IS_WINDOWS:
     import ctypes
-    import ctypes.wintypes
+    from ctypes import wintypes
+
+    # Kernel32 functions used to check whether a process is running.
+    # A private library object is used, so that setting the argument
+    # and return types doesn't affect other users of kernel32.
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _OpenProcess.restype = wintypes.HANDLE
+    _GetExitCodeProcess = _kernel32.GetExitCodeProcess
+    _GetExitCodeProcess.argtypes = (wintypes.HANDLE,
+            ctypes.POINTER(wintypes.DWORD))
+    _GetExitCodeProcess.restype = wintypes.BOOL
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = (wintypes.HANDLE, )
+    _CloseHandle.restype = wintypes.BOOL
 
 from logbook import FileHandler, StreamHandler
 
@@ -51,6 +69,9 @@ from process.log import ProcessLogger
 # Still running (Windows).
 _STILL_ACTIVE = 259
 
+# Arguments of the started processes, by process name
+_ARGV = {}
+
 class Process(metaclass=ABCMeta):
 
     """
@@ -97,7 +118,7 @@ class Process(metaclass=ABCMeta):
     async def start(self):
         """Called when the process start."""
         self.should_stop = asyncio.Event()
-        self.logger.debug(f"Starting process (PID={self.pid}...")
+        self.logger.debug("Starting process (PID={}...", self.pid)
         for name in type(self).services:
             module_name = f"service.{name}"
             module = import_module(module_name)
@@ -144,19 +165,17 @@ class Process(metaclass=ABCMeta):
             running (bool): whether the process is running or not.
 
         """
-        if platform.system() == "Windows":
-            kernel32 = ctypes.windll.kernel32
-            handle = kernel32.OpenProcess(1, 0, pid)
-            if handle == 0:
+        if _IS_WINDOWS:
+            handle = _OpenProcess(1, 0, pid)
+            if not handle:
                 return False
 
             # If the process exited recently, a PID may still
             # exist for the handle.  So, check if we can get the exit code.
-            exit_code = ctypes.wintypes.DWORD()
+            exit_code = wintypes.DWORD()
             is_running = (
-                kernel32.GetExitCodeProcess(handle,
-                ctypes.byref(exit_code)) == 0)
-            kernel32.CloseHandle(handle)
+                _GetExitCodeProcess(handle, ctypes.byref(exit_code)) == 0)
+            _CloseHandle(handle)
 
             # See if we couldn't get the exit code or the exit code indicates
             # that the process is still running.
@@ -178,12 +197,10 @@ class Process(metaclass=ABCMeta):
             command (str): the command to run.
 
         """
-        if platform.system() != 'Windows':
+        if not _IS_WINDOWS:
             command = split(command)
 
-        self.logger.debug(
-            f"Calling the {command!r} command"
-        )
+        self.logger.debug("Calling the {!r} command", command)
 
         return run(command).returncode
 
@@ -204,30 +221,33 @@ class Process(metaclass=ABCMeta):
         the command is called as is.  In other word, if the process
         name is "portal":
 
-          1.  If not frozen, executes 'python portal.py'.
-          2.  If frozen, executes 'portal'.
+          1.  If not frozen, executes 'portal.py' with the current
+              Python interpreter.
+          2.  If frozen, executes 'portal' ('portal.exe' on Windows).
+
+        The arguments are only built the first time a process name
+        is started, and the process is started without a shell.
 
         """
         # Under Windows, specify a different creation flag
-        creationflags = 0x08000000 if platform.system() == "Windows" else 0
-        command = f"python {process_name}.py"
+        creationflags = 0x08000000 if _IS_WINDOWS else 0
         frozen = getattr(sys, "frozen", False)
-        if frozen:
-            command = process_name
-            command += ".exe" if platform.system() == 'Windows' else ""
+        command = _ARGV.get(process_name)
+        if command is None:
+            if not frozen:
+                command = (sys.executable, f"{process_name}.py")
+            elif _IS_WINDOWS:
+                command = (f"{process_name}.exe", )
+            else:
+                command = (f"./{process_name}", )
+            _ARGV[process_name] = command
 
         stdout = stderr = PIPE
-        if platform.system() == 'Windows':
-            if frozen:
-                stdout = stderr = None
-        elif platform.system() == "Linux":
-            if frozen:
-                command = "./" + command
-            command = command.split(" ")
-
-        self.logger.debug(
-            f"Starting the {process_name!r} process: {command!r}"
-        )
+        if _IS_WINDOWS and frozen:
+            stdout = stderr = None
+
+        self.logger.debug("Starting the {!r} process: {!r}",
+                process_name, command)
         process = Popen(command, stdout=stdout, stderr=stderr,
             creationflags=creationflags)
 
@@ -36,6 +36,7 @@ from logbook import FileHandler, Logger
 from pony.orm import commit, core, db_session, set_sql_debug
 
 from data.base import db
+from data.handlers import OptionHandler
 from data.handlers.name import CommonNames
 from data.search import search_permission
 from service.base import BaseService
@@ -81,6 +82,7 @@ class Service(BaseService):
         """Clean the service up before shutting down."""
         if self.init_task:
             self.init_task.cancel()
+        OptionHandler.save_pending()
         Delay.persist(db)
         db_session.__exit__()
 
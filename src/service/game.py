@@ -153,16 +153,19 @@ class Service(BaseService):
                 await messaging.wait_for(lambda: len(messaging.running) == 0)
 
             # Collect other messages from this session if available
+            texts = [text]
             while not queue.empty():
-                text += b"\n" + queue.get_nowait()
+                texts.append(queue.get_nowait())
 
             # If appropriate, add the context prompt
             context = session.focused_context
             prompt = context.get_prompt()
             if prompt:
-                text += b"\n" + prompt.encode(
+                texts.append(prompt.encode(
                         session.options.get("encoding",
-                        settings.DEFAULT_ENCODING), errors="replace")
+                        settings.DEFAULT_ENCODING), errors="replace"))
+
+            text = b"\n".join(texts)
 
             if host.writer:
                 await host.send_cmd(host.writer, "output", dict(
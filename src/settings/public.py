@@ -103,6 +103,10 @@ FORBIDDEN_USERNAMES = ("talismud", "test", "guest", "new")
 # Minimum length of password (in characters)
 MIN_PASSWORD = 6
 
+# Maximum length of password (in characters).  Longer passwords
+# are refused without being hashed.
+MAX_PASSWORD = 256
+
 # Forbidden character names
 FORBIDDEN_CHARACTER_NAMES = FORBIDDEN_USERNAMES
 
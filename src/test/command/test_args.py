@@ -138,3 +138,20 @@ class TestCommandArgs(BaseTest):
         self.assertEqual(namespace.left, 1)
         self.assertEqual(namespace.word, "neg")
         self.assertEqual(namespace.right, 5)
+
+    def test_adjacent_unknown(self):
+        """Test that two arguments of unknown size can't follow."""
+        args = CommandArgs()
+        args.add_argument("text", dest="first")
+        with self.assertRaises(ValueError):
+            args.add_argument("text", dest="second")
+
+        args = CommandArgs()
+        args.add_argument("text")
+        with self.assertRaises(ValueError):
+            args.add_argument("options")
+
+        # A word has a known size, so a text can follow it
+        args = CommandArgs()
+        args.add_argument("word")
+        args.add_argument("text")
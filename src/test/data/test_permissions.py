@@ -100,3 +100,23 @@ class TestPermissions(BaseTest):
 
         # Make sure 'admin' isn't a tag
         self.assertFalse("admin" in character.tags)
+
+    def test_has_any_and_all(self):
+        """Check several permissions at once."""
+        character = self.create_character()
+        self.assertFalse(character.permissions.has_any(["admin", "builder"]))
+        self.assertTrue(character.permissions.has_all([]))
+
+        # Add a permission
+        character.permissions.add("builder")
+        self.assertTrue(character.permissions.has_any(["admin", "builder"]))
+        self.assertFalse(character.permissions.has_all(["admin", "builder"]))
+
+        # Add the second permission
+        character.permissions.add("admin", category="staff")
+        self.assertTrue(character.permissions.has_all(["admin", "builder"]))
+
+        # Remove both permissions
+        character.permissions.remove("builder")
+        character.permissions.remove("admin", category="staff")
+        self.assertFalse(character.permissions.has_any(["admin", "builder"]))
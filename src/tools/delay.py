@@ -53,7 +53,6 @@ delay.schedule(5, print, "After five seconds")
 import asyncio
 from datetime import datetime, timedelta
 from inspect import iscoroutine
-from itertools import count
 import pickle
 
 from logbook import FileHandler, Logger
@@ -84,7 +83,8 @@ class Delay:
     """
 
     _delays = {}
-    _current_id = count(1)
+    _nonpersistent_ids = set()
+    _next_id = 0
 
     def __init__(self, id, expire_at, callback, args, kwargs):
         self.id = id
@@ -92,48 +92,68 @@ class Delay:
         self.callback = callback
         self.args = args
         self.kwargs = kwargs
-        self.persistent = None
-        type(self)._delays[self.id] = self
+        self.pickled = None
+        self._persistent = None
+        cls = type(self)
+        cls._delays[self.id] = self
+        cls._nonpersistent_ids.add(self.id)
 
     def __repr__(self):
-        arguments = ", ".join(str(arg) for arg in self.args)
-        arguments += ", ".join(f"{key}={value}" for key, value
-                in self.kwargs.items())
-        return f"<Delay {self.id} {self.callback}({arguments})"
+        arguments = [str(arg) for arg in self.args]
+        arguments += [f"{key}={value}" for key, value in self.kwargs.items()]
+        return f"<Delay {self.id} {self.callback}({', '.join(arguments)})>"
+
+    @property
+    def persistent(self):
+        """Return the stored delay in the database, if any."""
+        return self._persistent
+
+    @persistent.setter
+    def persistent(self, persistent):
+        """Change the stored delay, keeping track of persistent delays."""
+        self._persistent = persistent
+        if persistent is None:
+            type(self)._nonpersistent_ids.add(self.id)
+        else:
+            type(self)._nonpersistent_ids.discard(self.id)
+
+    def _forget(self):
+        """Forget this delay, once executed."""
+        cls = type(self)
+        cls._delays.pop(self.id, None)
+        cls._nonpersistent_ids.discard(self.id)
+        if self.persistent:
+            self.persistent.delete()
 
     def _schedule(self):
         seconds = (self.expire_at - datetime.utcnow()).total_seconds()
         seconds = 0 if seconds < 0 else seconds
         loop = asyncio.get_event_loop()
         loop.call_later(seconds, self._execute)
-        logger.debug(f"Preparing to call {self!r} in {seconds} seconds")
+        logger.debug("Preparing to call {!r} in {} seconds", self, seconds)
 
     def _execute(self):
         """Prepare to execute."""
         try:
             result = self.callback(*self.args, **self.kwargs)
         except Exception:
-            logger.exception("An error occurred while executing {self!r}")
+            logger.exception("An error occurred while executing {!r}", self)
         else:
             if iscoroutine(result):
                 # Schedule it asynchronously
                 loop = asyncio.get_event_loop()
                 loop.create_task(self._async_execute(result))
             else:
-                type(self)._delays.pop(self.id, None)
-                if self.persistent:
-                    self.persistent.delete()
+                self._forget()
 
     async def _async_execute(self, coroutine):
         """Execute the delayed action."""
         try:
             await coroutine
         except Exception:
-            logger.exception("An error occurred while executing {self!r}")
+            logger.exception("An error occurred while executing {!r}", self)
         finally:
-            type(self)._delays.pop(self.id, None)
-            if self.persistent:
-                self.persistent.delete()
+            self._forget()
 
     @classmethod
     def schedule(cls, *args, **kwargs):
@@ -181,8 +201,9 @@ class Delay:
             raise ValueError("cannot pickle this callback")
 
         # Create and return a delay
-        id = next(cls._current_id)
-        obj = cls(id, expire_at, callback, args, kwargs)
+        cls._next_id += 1
+        obj = cls(cls._next_id, expire_at, callback, args, kwargs)
+        obj.pickled = to_store
         obj._schedule()
         return obj
 
@@ -192,9 +213,26 @@ class Delay:
 
     @classmethod
     def persist(cls, db):
-        """Persist all non-persistent delays."""
-        for id, delay in cls._delays.items():
-            if delay.persistent is None:
+        """
+        Persist all non-persistent delays.
+
+        The rows are prepared first, since persisting a delay removes
+        it from the set of non-persistent delays.  They are written
+        one at a time and committed when the database session ends.
+
+        """
+        rows = []
+        for id in cls._nonpersistent_ids:
+            delay = cls._delays[id]
+            pickled = delay.pickled
+            if pickled is None:
                 pickled = cls._pickled(delay.callback, delay.args, delay.kwargs)
-                db.Delay(expire_at=delay.expire_at, pickled=pickled)
-                logger.debug(f"Persisting {delay!r} in the database.")
+            rows.append((delay, pickled))
+
+        if not rows:
+            return
+
+        for delay, pickled in rows:
+            delay.persistent = db.Delay(expire_at=delay.expire_at,
+                    pickled=pickled)
+        logger.debug("Persisted {} delays in the database.", len(rows))
@@ -82,57 +82,47 @@ class ListView:
     def render(self) -> str:
         """Render the list view, returning a formatted string."""
         # Determine the maximum lenth of all items
-        bigger_item = max(len(item) for separator, section in self.sections
+        bigger_item = max(len(item) for _, section in self.sections
                 for item in section)
 
         # Determine the number of columns
         min_col = self.min_col or 0
         col_width = max(min_col, bigger_item + 1)
-        num_cols = (self.max_width - self.items.indent_width) // col_width
+        indent_width = self.items.indent_width
+        num_cols = (self.max_width - indent_width) // col_width
 
         # Create sections
+        indent = indent_width * ' '
+        orientation = self.orientation
         lines = []
         for separator, items in self.sections:
             if separator:
                 lines.append(separator)
 
             # Display the lines of items
-            num_lines = len(items) // num_cols
-            if num_lines * num_cols < len(items):
-                num_lines += 1
+            num_lines = -(-len(items) // num_cols)
 
             line_items = []
             for num_line in range(num_lines):
                 line_items.append([''] * num_cols)
 
-            col = line = 0
-            if self.orientation is ListViewOrientation.HORIZONTAL:
+            if orientation is ListViewOrientation.HORIZONTAL:
                 # aa, ab, ac are placed on the same line
-                for item in items:
+                for i, item in enumerate(items):
+                    line, col = divmod(i, num_cols)
                     line_items[line][col] = item
-                    if col + 1 == num_cols:
-                        line += 1
-                        col = 0
-                    else:
-                        col += 1
-            elif self.orientation is ListViewOrientation.VERTICAL:
+            elif orientation is ListViewOrientation.VERTICAL:
                 # aa, ab, ac are placed on the same column
-                for item in items:
+                for i, item in enumerate(items):
+                    col, line = divmod(i, num_lines)
                     line_items[line][col] = item
-                    if line + 1 == num_lines:
-                        col += 1
-                        line = 0
-                    else:
-                        line += 1
             else:
                 raise ValueError("invalid orientation")
 
             # Display the result
             for line_item in line_items:
-                line = self.items.indent_width * ' '
-                for item in line_item:
-                    line += str(item).ljust(col_width)
-
+                line = indent + "".join(item.ljust(col_width)
+                        for item in line_item)
                 lines.append(line.rstrip(' '))
 
         return "\n".join(lines)
@@ -142,10 +142,10 @@ class BuilderWindow(Window):
             return
 
         room = self.blueprint.coords[tuple(self.map_center)]
-        if [exit for exit in room.cleaned.exits if
-                exit.cleaned.name == exit_to]:
+        cleaned = room.cleaned
+        if any(exit.cleaned.name == exit_to for exit in cleaned.exits):
             self.pop_alert("Error",
-                    f"The current room {room.cleaned.barcode} already "
+                    f"The current room {cleaned.barcode} already "
                     f"has an exit leading toward {exit_to}."
             )
             return
@@ -170,27 +170,22 @@ class BuilderWindow(Window):
 
     def update_map(self):
         """Update the map according to the specified file."""
-        coords = self.blueprint.coords
-        current_map = ""
         min_x = self.map_center[0] - self.map_size - 1
         min_y = self.map_center[1] + self.map_size + 1
         max_x = self.map_center[0] + self.map_size + 1
         max_y = self.map_center[1] - self.map_size - 1
         z = self.map_center[2]
+        width = max_x + 1 - min_x
+        height = len(range(min_y, max_y + 1, -1))
 
-        for y in range(min_y, max_y + 1, -1):
-            if current_map:
-                current_map += "\n"
+        # Start from a blank grid and only place the rooms of this plane
+        grid = [[" "] * width for _ in range(height)]
+        plane = self.blueprint.coords_by_z.get(z, {})
+        for (x, y), room in plane.items():
+            if room and min_x <= x <= max_x and max_y + 1 < y <= min_y:
+                grid[min_y - y][x - min_x] = "#"
 
-            for x in range(min_x, max_x + 1):
-                cell = " "
-                room = coords.get((x, y, z))
-                if room:
-                    cell = "#"
-
-                current_map += cell
-
-        self["map"].value = current_map
+        self["map"].value = "\n".join("".join(row) for row in grid)
         self["map"].cursor.move(self.map_size + 1, self.map_size + 1)
         cursor = self["map"].cursor
 
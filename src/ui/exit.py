@@ -29,7 +29,7 @@
 
 """Exit dialog, to add or edit exits."""
 
-from collections import deque
+from bisect import bisect_left, bisect_right
 
 from bui.widget.dialog import Dialog
 
@@ -51,6 +51,7 @@ class EditExit(Dialog):
         # Suggestions
         self.suggested_begin = None
         self.suggested_list = None
+        self.suggested_index = 0
 
     def on_ok(self, control):
         """When the OK button is clocked."""
@@ -60,8 +61,7 @@ class EditExit(Dialog):
                     message="You have to specify a name.")
             control.stop()
 
-        exits = {exit.cleaned.name: exit.cleaned for exit in self.room.exits}
-        if name in exits:
+        if any(exit.cleaned.name == name for exit in self.room.exits):
             self.pop_alert(title="Error",
                     message=f"There already is an exit named {name} "
                     "in this room.")
@@ -85,11 +85,13 @@ class EditExit(Dialog):
 
     def scroll_through_suggestions(self, widget, control, key):
         """Browse the list of suggestions."""
-        rotation = -1 if key == "down" else 1
+        step = 1 if key == "down" else -1
         self.update_suggestions()
-        self.suggested_list.rotate(rotation)
-        widget.value = self.suggested_list[0]
-        widget.cursor.move(0)
+        if self.suggested_list:
+            self.suggested_index = (
+                    self.suggested_index + step) % len(self.suggested_list)
+            widget.value = self.suggested_list[self.suggested_index]
+            widget.cursor.move(0)
         control.stop()
     on_press_down_in_destination = scroll_through_suggestions
     on_press_up_in_destination = scroll_through_suggestions
@@ -101,7 +103,11 @@ class EditExit(Dialog):
     def update_suggestions(self):
         """Make sure suggestions exist."""
         if self.suggested_list is None:
-            self.suggested_begin = self["destination"].value
-            self.suggested_list = deque([room.cleaned.barcode for room in
-                    self.blueprint.rooms.values()
-                    if room.cleaned.barcode.startswith(self.suggested_begin)])
+            begin = self.suggested_begin = self["destination"].value
+
+            # Barcodes are sorted, so the matches are a contiguous slice
+            barcodes = self.blueprint.barcodes
+            first = bisect_left(barcodes, begin)
+            last = bisect_right(barcodes, begin + "\uffff", first)
+            self.suggested_list = barcodes[first:last]
+            self.suggested_index = 0
@@ -97,19 +97,20 @@ class EditRoom(Dialog):
             # If it's a two-way exit, create the back exit in the destination
             if back:
                 destination = self.blueprint.rooms[destination]
-                back_exits = [exit for exit in destination.cleaned.exits
-                        if exit.cleaned.name == back or
-                        exit.cleaned.destination == self.room.barcode]
+                exits = destination.cleaned.exits
+                barcode = self.room.barcode
+                has_back = any((cleaned := exit.cleaned).name == back or
+                        cleaned.destination == barcode for exit in exits)
 
-                if not back_exits:
+                if not has_back:
                     back_exit = self.blueprint.create_document({
                         "type": "exit",
                         "name": back,
                         "back": name,
                         "origin": destination,
-                        "destination": self.room.barcode,
+                        "destination": barcode,
                     })
-                    destination.cleaned.exits.append(back_exit)
+                    exits.append(back_exit)
 
             # In any case, update the exit list
             self.update_exits(name)
@@ -1,6 +1,7 @@
 from aiohttp import web
 
 from data.base import db
+from web.log import logger
 
 async def post(request, session):
     data = await request.post()
@@ -13,8 +14,10 @@ async def post(request, session):
         # Check the password
         password = data.get("password", "")
         if account.is_correct_password(password):
-            session["account"] = account
+            session["account"] = account.id
             raise web.HTTPFound('/')
 
 async def get(session):
-    print(f"this request is logged in as: {session.get('account', None)}")
+    account_id = session.get("account", None)
+    account = db.Account.get(id=account_id) if account_id else None
+    logger.debug("This request is logged in as: {}", account)
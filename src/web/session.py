@@ -30,32 +30,108 @@
 """Web session entity."""
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 import pickle
 import typing as ty
 from uuid import UUID, uuid4
 
 from aiohttp_session import AbstractStorage, Session
-from cryptography.fernet import Fernet, InvalidToken
 from pony.orm import Optional, PrimaryKey, Required, Set
 
 from data.base import db, PicklableEntity
 from web.log import logger
 
-secret_file = Path() / "settings" / "private.key"
-if secret_file.exists():
-    logger.debug("Load the Fernet secret key from file")
-    with secret_file.open("rb") as file:
-        SECRET_KEY = file.read()
-else:
-    logger.debug("Generate a new Fernet key")
-    SECRET_KEY = Fernet.generate_key()
-    with secret_file.open("wb") as file:
-        file.write(SECRET_KEY)
+@lru_cache(maxsize=None)
+def get_fernet():
+    """
+    Return the Fernet object used to encrypt session cookies.
+
+    The secret key is loaded from the settings, or generated if it
+    doesn't exist yet.  This is only done when a cookie has to be
+    encrypted or decrypted, so that processes which don't serve web
+    pages don't need to import the cryptography package.
+
+    """
+    from cryptography.fernet import Fernet
+
+    secret_file = Path() / "settings" / "private.key"
+    if secret_file.exists():
+        logger.debug("Load the Fernet secret key from file")
+        with secret_file.open("rb") as file:
+            secret_key = file.read()
+    else:
+        logger.debug("Generate a new Fernet key")
+        secret_key = Fernet.generate_key()
+        with secret_file.open("wb") as file:
+            file.write(secret_key)
+
+    return Fernet(secret_key)
+
+# Pickled empty data, the default for all web sessions
+EMPTY_DATA = pickle.dumps({}, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Minimum delay between two updates of a web session's `updated_on`
+UPDATE_DELAY = timedelta(minutes=1)
+
+def encrypt_key(key: str) -> str:
+    """
+    Encrypt a session key, returning the cookie value.
+
+    Args:
+        key (str): the session key.
+
+    Returns:
+        cookie (str): the encrypted key, to be stored in the cookie.
+
+    """
+    return get_fernet().encrypt(key.encode()).decode()
+
+@lru_cache(maxsize=4096)
+def decrypt_key(token: bytes) -> ty.Optional[str]:
+    """
+    Decrypt a session cookie, returning the session key.
+
+    The same cookie is sent with every request of a browser, so the
+    result is cached to avoid decrypting it over and over again.
+
+    Args:
+        token (bytes): the encrypted cookie.
+
+    Returns:
+        key (str or None): the decrypted key, or None if the token
+                is invalid.
+
+    """
+    from cryptography.fernet import InvalidToken
 
+    try:
+        key = get_fernet().decrypt(token)
+    except InvalidToken:
+        return None
 
-FERNET = Fernet(SECRET_KEY)
+    return key.decode()
+
+@lru_cache(maxsize=4096)
+def parse_uuid(key: str) -> ty.Optional[UUID]:
+    """
+    Parse a session key, returning its UUID.
+
+    UUIDs are immutable, so the same object can be returned for
+    every request using this session key.
+
+    Args:
+        key (str): the session key.
+
+    Returns:
+        uuid (UUID or None): the UUID, or None if the key is invalid.
+
+    """
+    try:
+        return UUID(key)
+    except ValueError:
+        return None
 
 class WebSession(PicklableEntity, db.Entity):
 
@@ -79,55 +155,82 @@ class WebSession(PicklableEntity, db.Entity):
         db_data (bytes): the data as an unpickled dictionary.
 
     Properties:
-        data: read-only, retrieve the data as a dictionary.
+        data: the data as a dictionary, unpickled only once.  It is
+                cached on the instance, so it is forgotten with it.
 
     """
 
     uuid = PrimaryKey(UUID, default=uuid4)
     updated_on = Required(datetime, default=datetime.utcnow)
     account = Optional("Account")
-    db_data = Required(bytes, default=pickle.dumps({}))
+    db_data = Required(bytes, default=EMPTY_DATA)
 
     @property
     def data(self):
         """Return the unpickled data as a dict."""
-        return pickle.loads(self.db_data)
+        data = self.__dict__.get("_data_cache")
+        if data is None:
+            if self.db_data == EMPTY_DATA:
+                data = {}
+            else:
+                data = pickle.loads(self.db_data)
+            self.__dict__["_data_cache"] = data
+
+        return data
+
     @data.setter
     def data(self, data):
-        self.db_data = pickle.dumps(data)
+        """Change the data, pickling it."""
+        if not data:
+            self.db_data = EMPTY_DATA
+        else:
+            self.db_data = pickle.dumps(data,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        self.__dict__["_data_cache"] = data
 
 
 class PonyStorage(AbstractStorage):
 
-    """Bridge between AIOHTTP sessions and PonyORM."""
+    """
+    Bridge between AIOHTTP sessions and PonyORM.
+
+    The cookie only contains the encrypted session key, the session
+    data is stored in the database.  Therefore, the storage encoder
+    and decoder are never used.
+
+    """
+
+    def new_session(self):
+        """
+        Return a new, empty session.
+
+        Sessions are modified by the programs handling the request,
+        so an empty session can't be shared between requests.
+
+        """
+        return Session(None, data=None, new=True, max_age=self.max_age)
 
     async def load_session(self, request):
         """Retrieve the WebSession data for a request."""
         cookie = self.load_cookie(request)
         if cookie is None:
-            print("No cookie saved for this request, just create one.")
-            return Session(None, data=None, new=True, max_age=self.max_age)
+            logger.debug("No cookie saved for this request, just create one.")
+            return self.new_session()
         else:
             token = cookie.encode()
-            try:
-                key = FERNET.decrypt(token)
-            except InvalidToken:
-                print("This is not a valid token", token)
-                return Session(None, data=None, new=True, max_age=self.max_age)
-
-            key = key.decode()
-            try:
-                uuid = UUID(key)
-            except ValueError:
-                session = None
-            else:
-                session = WebSession.get(uuid=uuid)
+            key = decrypt_key(token)
+            if key is None:
+                logger.debug("The session cookie is not a valid token")
+                return self.new_session()
+
+            uuid = parse_uuid(key)
+            session = None if uuid is None else WebSession.get(uuid=uuid)
 
             if session is None:
-                return Session(None, data=None, new=True, max_age=self.max_age)
+                return self.new_session()
 
             data = session.data
-            print(f"Data for this session: {data}")
+            logger.debug("Data for this session: {}", data)
             return Session(key, data=data, new=False, max_age=self.max_age)
 
     async def save_session(self, request, response, session):
@@ -135,35 +238,42 @@ class PonyStorage(AbstractStorage):
         key = session.identity
         if key is None:
             key = uuid4().hex
-            encrypted = FERNET.encrypt(key.encode()).decode()
-            print(f"this session doesn't exist, create a cookie (key={key}, enc={encrypted})")
+            encrypted = encrypt_key(key)
+            logger.debug("This session doesn't exist, create a cookie")
             self.save_cookie(response, encrypted,
                     max_age=session.max_age)
         else:
-            print(f"session {key} is empty")
             if session.empty:
+                logger.debug("Session {} is empty", key)
                 self.save_cookie(response, '', max_age=session.max_age)
             else:
                 key = str(key)
-                encrypted = FERNET.encrypt(key.encode()).decode()
-                print(f"session {key} exists and the key is resaved in the cookie")
+                encrypted = encrypt_key(key)
+                logger.debug("Session {} exists and the key is resaved "
+                        "in the cookie", key)
                 self.save_cookie(response, encrypted,
                         max_age=session.max_age)
 
         data = self._get_session_data(session)
-        try:
-            uuid = UUID(key)
-        except ValueError:
+        uuid = parse_uuid(key)
+        if uuid is None:
             return
 
         session = db.WebSession.get(uuid=uuid)
         if session is None:
-            print("the session doesn't exist in PonyORM, create it.")
+            logger.debug("The session doesn't exist in PonyORM, create it.")
             session = db.WebSession(uuid=uuid)
 
-        print(f"update session data to {data}")
+        # The session is only saved when it was marked as changed,
+        # its data may have been modified in place, so always store it
+        logger.debug("Update session data to {}", data)
         session.data = data
-        session.updated_on = datetime.utcnow()
+
+        # Don't mark the session as modified for every single request,
+        # a recent update time is good enough
+        now = datetime.utcnow()
+        if now - session.updated_on >= UPDATE_DELAY:
+            session.updated_on = now
 
     def __get_store_key(self, key):
         return (self.cookie_name + '_' + key).encode('utf-8')
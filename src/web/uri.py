@@ -29,13 +29,13 @@
 
 """URI, connecting a page and optional programs."""
 
+from importlib.machinery import SourceFileLoader
 import inspect
 from pathlib import Path
 import types
 
 from aiohttp import web
 from aiohttp_session import get_session
-from Cheetah.Template import Template
 
 import settings
 
@@ -60,38 +60,54 @@ class URI:
         self.program = None
         self.page = None
         self.methods = {}
+        self.cached_body = None
 
         # Additional information (not required)
+        self.page_class = None
         self.template_path = None
         self.program_path = None
 
     async def process(self, request):
         """Process the current URI."""
         # Execute the program, if any
-        program, signature = self.methods.get(request.method.lower(),
-                (None, None))
-        self.page.messages = []
+        program, parameters = self.methods.get(request.method.lower(),
+                None) or (None, None)
+        page = self.page
+        if page is not None:
+            page.messages = []
+
         if program:
             # Dynamically build keyword arguments
-            parameters = tuple(signature.parameters.keys())
-            kwargs = {}
-            for key, value in request.match_info.items():
-                if key in parameters:
-                    kwargs[key] = value
+            kwargs = {key: value for key, value in request.match_info.items()
+                    if key in parameters}
 
             if "request" in parameters:
                 kwargs["request"] = request
 
             if "page" in parameters:
-                kwargs["page"] = self.page
+                kwargs["page"] = page
 
             if "session" in parameters:
                 kwargs["session"] = await get_session(request)
 
             result = await program(**kwargs)
 
-        response = str(self.page)
-        return web.Response(text=response, content_type="text/html")
+        # Without a page, there's nothing to render
+        if page is None:
+            return web.Response(status=204)
+
+        # A page can only change if the program has access to it,
+        # otherwise it always renders the same way
+        static = program is None or "page" not in parameters
+        if static and self.cached_body is not None:
+            body = self.cached_body
+        else:
+            body = str(page).encode("utf-8")
+            if static:
+                self.cached_body = body
+
+        return web.Response(body=body, content_type="text/html",
+                charset="utf-8")
 
     @staticmethod
     def gather():
@@ -116,6 +132,8 @@ class URI:
             uris (list): list of URIs.
 
         """
+        from Cheetah.Template import Template
+
         uris = {}
 
         # First, gather the programs
@@ -128,14 +146,15 @@ class URI:
             for program_path in programs_path.rglob("*.py"):
                 uri = program_path.relative_to(programs_path).as_posix()[:-3]
 
-                # Read the module and execute it, instead of importing it
-                # This is due to the fact that the path might not be
-                # valid Python.
-                with program_path.open("r", encoding="utf-8") as file:
-                    content = file.read()
-
+                # Load the module code and execute it, instead of importing
+                # it.  This is due to the fact that the path might not be
+                # valid Python.  The loader caches the compiled code in
+                # __pycache__, so unchanged programs aren't parsed again.
+                loader = SourceFileLoader(uri, str(program_path))
+                code = loader.get_code(uri)
                 program = types.ModuleType(uri)
-                exec(content, program.__dict__)
+                program.__file__ = str(program_path)
+                exec(code, program.__dict__)
 
                 # Create an URI object
                 uri = URI.parse_uri(uri)
@@ -154,8 +173,9 @@ class URI:
                     if key not in ("get", "post", "put", "delete"):
                         continue
 
-                    signature = inspect.signature(value)
-                    resource.methods[key] = (value, signature)
+                    # Keep the parameter names, the signature won't change
+                    parameters = inspect.signature(value).parameters
+                    resource.methods[key] = (value, frozenset(parameters))
                 uris[resource.uri] = resource
 
             # Gather the pages
@@ -164,7 +184,9 @@ class URI:
                 with page_path.open("r", encoding="utf-8") as file:
                     content = file.read()
 
-                template = Template(content)
+                # Compile the template into a class once, reuse an instance
+                template_class = Template.compile(source=content)
+                template = template_class()
                 uri = page_path.relative_to(pages_path).as_posix()[:-5]
                 uri = "/" + URI.parse_uri(uri)
                 if uri.endswith("/index"):
@@ -173,6 +195,7 @@ class URI:
                 if resource is None:
                     resource = URI(uri)
                     uris[uri] = resource
+                resource.page_class = template_class
                 resource.page = template
                 resource.page_path = page_path.relative_to(web_path)
 